@@ -5,6 +5,7 @@ from .client import (
 )
 from .errors import (
     BadRequest,
+    BulkheadFull,
     InternalServiceError,
     NotFound,
     ServiceClientError,
@@ -20,6 +21,7 @@ __all__ = [
     "NotFound",
     "BadRequest",
     "ServiceError",
+    "BulkheadFull",
     "BaseServiceClient",
     "send_bulk_internal_requests",
 ]
@@ -0,0 +1,13 @@
+"""
+This module provides internal URL parsing helpers shared by the auth and session modules.
+"""
+
+import functools
+from urllib.parse import urlsplit
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_url(url):
+    """Returns (netloc, path) for a URL, cached because hot callers reuse the same URLs."""
+    parts = urlsplit(url)
+    return parts.netloc, parts.path
@@ -0,0 +1,141 @@
+"""
+This module provides an aiohttp-based session cache for asyncio applications.
+
+One event-loop thread can hold thousands of in-flight RPCs at coroutine cost
+instead of one OS thread (and stack) per call. The circuit breaker here is a
+small asyncio-friendly state machine rather than pybreaker, whose storage
+locking is thread-oriented; it reuses the same fail_max/reset_timeout
+constants as the sync stack.
+"""
+
+import logging
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    raise RuntimeError("aiohttp is required to use this module.")
+
+from ._urlutil import _split_url
+from .errors import InternalServiceError
+from .http_session import DEFAULT_FAIL_MAX, DEFAULT_RESET_TIMEOUT, DEFAULT_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONNECTOR_LIMIT = 100
+DEFAULT_LIMIT_PER_HOST = 20
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+
+# Per-host caches; everything runs on the event loop thread, so plain dicts
+# are safe without locks.
+_session_cache = {}
+_breakers = {}
+
+
+class _AsyncCircuitBreaker:
+    """Minimal CLOSED/OPEN/HALF_OPEN breaker for single-event-loop use."""
+
+    def __init__(
+        self, host, fail_max=DEFAULT_FAIL_MAX, reset_timeout=DEFAULT_RESET_TIMEOUT
+    ):
+        self.host = host
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.fail_count = 0
+        self.state = "closed"
+        self.opened_at = 0.0
+
+    def before_call(self):
+        """Fails fast while open; lets one probe through after the reset timeout."""
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise InternalServiceError(
+                    f"Circuit breaker is open for {self.host}. Failing fast."
+                )
+            self.state = "half-open"
+
+    def on_success(self):
+        self.fail_count = 0
+        self.state = "closed"
+
+    def on_failure(self):
+        self.fail_count += 1
+        if self.state == "half-open" or self.fail_count >= self.fail_max:
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            logger.warning(f"Async circuit breaker opened for host: {self.host}")
+
+
+def _get_breaker(host) -> _AsyncCircuitBreaker:
+    """Returns the breaker for a host, creating it on first use."""
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = _AsyncCircuitBreaker(host)
+    return breaker
+
+
+def get_aio_session(base_url) -> "aiohttp.ClientSession":
+    """
+    Retrieves the cached aiohttp.ClientSession for a given base_url.
+
+    Must be called from a running event loop. A closed session (e.g. after
+    loop teardown in tests) is transparently replaced.
+
+    Args:
+        base_url (str): The base URL of the service.
+
+    Returns:
+        aiohttp.ClientSession: The session for the given base_url.
+    """
+    host = _split_url(base_url)[0]
+
+    session = _session_cache.get(host)
+    if session is None or session.closed:
+        connect_timeout, read_timeout = DEFAULT_TIMEOUT
+        session = _session_cache[host] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=DEFAULT_CONNECTOR_LIMIT,
+                limit_per_host=DEFAULT_LIMIT_PER_HOST,
+                keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+            ),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=connect_timeout, sock_read=read_timeout
+            ),
+        )
+
+    return session
+
+
+async def aio_request(method, url, **kwargs) -> "aiohttp.ClientResponse":
+    """
+    Sends one request through the cached aiohttp session and the host's breaker.
+
+    Args:
+        method (str): The HTTP method to use for the request.
+        url (str): The URL to make the request to.
+        **kwargs: Additional keyword arguments passed to aiohttp.
+
+    Returns:
+        aiohttp.ClientResponse: The response from the request.
+
+    Raises:
+        InternalServiceError: When the circuit is open or the connection fails.
+    """
+    breaker = _get_breaker(_split_url(url)[0])
+    breaker.before_call()
+
+    session = get_aio_session(url)
+    try:
+        response = await session.request(method, url, **kwargs)
+    except aiohttp.ClientError as e:
+        breaker.on_failure()
+        error_message = f"Failed to connect to {method} {url}. Error: {e}"
+        logger.error(error_message)
+        raise InternalServiceError(error_message) from e
+
+    if response.status >= 500:
+        breaker.on_failure()
+    else:
+        breaker.on_success()
+
+    return response
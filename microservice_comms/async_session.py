@@ -0,0 +1,101 @@
+"""
+This module provides an httpx-based async client cache for high-fanout callers.
+
+HTTP/2 multiplexes many in-flight requests over a single TCP+TLS connection,
+so large fan-outs avoid per-socket handshakes entirely. The sync
+requests-based stack in http_session stays the default for legacy callers.
+"""
+
+import logging
+import threading
+
+try:
+    import httpx
+except ImportError:
+    raise RuntimeError("httpx is required to use this module.")
+
+from ._urlutil import _split_url
+from .http_session import (
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+    _get_breaker,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEEPALIVE_CONNECTIONS = 20
+
+# Global async client cache, keyed by host like the sync session cache.
+_client_cache = {}
+_client_cache_lock = threading.Lock()
+
+
+def create_async_client(base_url: str) -> "httpx.AsyncClient":
+    """
+    Creates an httpx.AsyncClient for the given base_url.
+
+    The client is configured with HTTP/2 enabled (requires the h2 extra,
+    install as httpx[http2]), connection limits matching the sync pool, and
+    the shared (connect, read) timeout split.
+
+    :param base_url: The base URL of the service.
+    :return: An httpx.AsyncClient.
+    """
+    connect_timeout, read_timeout = DEFAULT_TIMEOUT
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=DEFAULT_POOL_MAXSIZE,
+            max_keepalive_connections=DEFAULT_KEEPALIVE_CONNECTIONS,
+        ),
+        timeout=httpx.Timeout(
+            connect=connect_timeout, read=read_timeout, write=read_timeout, pool=None
+        ),
+    )
+
+
+def get_async_client(base_url: str) -> "httpx.AsyncClient":
+    """
+    Retrieves the cached httpx.AsyncClient for a given base_url.
+
+    Mirrors http_session.get_session: one long-lived client per host, created
+    on first use behind a lock.
+
+    Args:
+        base_url (str): The base URL of the service.
+
+    Returns:
+        httpx.AsyncClient: The client for the given base_url.
+    """
+    host = _split_url(base_url)[0]
+
+    client = _client_cache.get(host)
+    if client is not None:
+        return client
+
+    with _client_cache_lock:
+        client = _client_cache.get(host)
+        if client is None:
+            client = _client_cache[host] = create_async_client(base_url)
+
+        return client
+
+
+async def async_request(method, url, **kwargs) -> "httpx.Response":
+    """
+    Sends one async request through the cached client and the host's breaker.
+
+    Shares circuit-breaker state with the sync stack, so a host tripped by
+    sync traffic fails fast here too.
+
+    Args:
+        method (str): The HTTP method to use for the request.
+        url (str): The URL to make the request to.
+        **kwargs: Additional keyword arguments passed to httpx.
+
+    Returns:
+        httpx.Response: The response from the request.
+    """
+    client = get_async_client(url)
+    breaker = _get_breaker(_split_url(url)[0])
+    return await breaker.call_async(client.request, method, url, **kwargs)
@@ -2,34 +2,77 @@
 This module provides functions for generating HMAC headers for internal service requests and API Key headers.
 """
 
+import base64
+import functools
 import hashlib
 import hmac
+import sys
 import time
-from urllib.parse import urlparse
+
+from ._urlutil import _split_url
+
+# Interned header keys/values: every request shares the same string objects,
+# so headers.update() reuses cached hashes instead of recomputing them.
+_K_SERVICE_ID = sys.intern("X-Service-ID")
+_K_TIMESTAMP = sys.intern("X-Timestamp")
+_K_SIGNATURE = sys.intern("X-Signature")
+_K_API_KEY = sys.intern("X-API-Key")
+_K_CONTENT_TYPE = sys.intern("Content-Type")
+_V_CONTENT_TYPE = sys.intern("application/json")
+
+
+# Timestamp cache: signatures only have one-second granularity, so the
+# str/encode conversions are refreshed at most once per wall-clock second.
+# The cache is an immutable tuple swapped by reference, so readers always
+# see a matching (second, str, bytes) triple even while a writer rebinds it.
+_TS_CACHE = (0, "", b"")
+
+
+def _current_timestamp():
+    """Returns the current unix second as (str, bytes), cached per second."""
+    global _TS_CACHE
+    now = time.time_ns() // 1_000_000_000
+    cached_second, text, raw = _TS_CACHE
+    if now != cached_second:
+        text = str(now)
+        raw = text.encode()
+        _TS_CACHE = (now, text, raw)
+    return text, raw
+
+
+@functools.lru_cache(maxsize=64)
+def _hmac_prototype(secret):
+    """Returns a keyed HMAC-SHA256 prototype; copies skip the per-request key schedule."""
+    return hmac.new(secret.encode(), b"", hashlib.sha256)
 
 
 def generate_internal_headers(method, url, service_id, secret):
-    """Generates HMAC headers for internal service requests."""
-    timestamp = str(int(time.time()))
-    method = method.upper()
-    path = urlparse(url).path
+    """Generates HMAC headers for internal service requests.
+
+    The method is expected to already be upper-cased by the caller.
+    X-Signature carries base64(HMAC-SHA256), 44 chars instead of the
+    64-char hex form.
+    """
+    timestamp, timestamp_bytes = _current_timestamp()
+    path = _split_url(url)[1]
 
-    raw_message = f"{method}|{path}|{timestamp}".encode()
-    secret_bytes = secret.encode()
-    signature = hmac.new(secret_bytes, raw_message, hashlib.sha256).hexdigest()
+    raw_message = b"%s|%s|%s" % (method.encode(), path.encode(), timestamp_bytes)
+    digest = _hmac_prototype(secret).copy()
+    digest.update(raw_message)
+    signature = base64.b64encode(digest.digest()).decode("ascii")
 
     return {
-        "X-Service-ID": service_id,
-        "X-Timestamp": timestamp,
-        "X-Signature": signature,
-        "Content-Type": "application/json",
+        _K_SERVICE_ID: service_id,
+        _K_TIMESTAMP: timestamp,
+        _K_SIGNATURE: signature,
+        _K_CONTENT_TYPE: _V_CONTENT_TYPE,
     }
 
 
 def generate_api_key_header(api_key, service_id):
     """Generates API Key headers."""
     return {
-        "X-Service-ID": service_id,
-        "X-API-Key": api_key,
-        "Content-Type": "application/json",
+        _K_SERVICE_ID: service_id,
+        _K_API_KEY: api_key,
+        _K_CONTENT_TYPE: _V_CONTENT_TYPE,
     }
@@ -2,21 +2,184 @@
 This module provides a base client class for making requests to internal services.
 """
 
+import copy
+import json
 import logging
+import time
 
+import pybreaker
 import requests
+import urllib3
+
+from concurrent.futures import ThreadPoolExecutor
 
 try:
-    from gevent.pool import Pool
+    import orjson
 except ImportError:
-    raise RuntimeError("gevent is required to use this module.")
+    # orjson is optional; error-body parsing falls back to the stdlib.
+    orjson = None
 
-from .auth import generate_api_key_header, generate_internal_headers
+try:
+    from gevent.pool import Pool
+except ImportError:
+    # Without gevent, bulk requests fall back to a bounded thread pool.
+    Pool = None
+
+from ._urlutil import _split_url
+from .auth import (
+    _current_timestamp,
+    generate_api_key_header,
+    generate_internal_headers,
+)
 from .errors import BadRequest, InternalServiceError, NotFound, ServiceError
-from .http_session import get_session, invalidate_session
+from .http_session import (
+    DEFAULT_TIMEOUT,
+    get_session,
+    invalidate_session,
+    is_circuit_open,
+    urllib3_request,
+)
 
 logger = logging.getLogger(__name__)
-DEFAULT_TIMEOUT = 10
+DEFAULT_BULK_POOL_SIZE = 50
+
+# Canonical upper-case methods so hot paths skip a str.upper() per call.
+_METHODS = {m: m for m in ("GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH")}
+
+# Keys consumed by the bulk prep loop itself; everything else goes to requests.
+_RESERVED_BULK_KEYS = frozenset(
+    {"method", "url", "endpoint", "headers", "need_hmac_header", "timeout"}
+)
+
+# Kwargs the urllib3 fast path understands; requests-only extras are dropped.
+_URLLIB3_KWARGS = frozenset({"params", "json", "data"})
+
+def _json_message(response, default_message):
+    """
+    Extracts the "message" field from an error response body.
+
+    Parses response.content directly (with orjson when available) instead of
+    going through response.json(), which is hot on 4xx-heavy traffic.
+
+    Returns:
+        str or None: The message (or default_message if the field is absent),
+        or None when the body is not a JSON object.
+    """
+    try:
+        if orjson is not None:
+            payload = orjson.loads(response.content)
+        else:
+            payload = json.loads(response.content)
+        return payload.get("message", default_message)
+    except (ValueError, AttributeError):
+        return None
+
+
+def _safe_body(response, limit=512):
+    """
+    Returns a bounded preview of the response body for error messages.
+
+    Slices response.content and decodes with errors="replace", skipping the
+    charset detection that response.text runs on every access and keeping log
+    lines a predictable size.
+    """
+    return response.content[:limit].decode("utf-8", errors="replace")
+
+
+def _bad_request_error(response, url):
+    """Builds the BadRequest exception for a 400 response."""
+    message = _json_message(response, "Bad Request")
+    if message is None:
+        message = f"Bad Request at {url} with non-JSON response. {_safe_body(response)}"
+    return BadRequest(message)
+
+
+def _not_found_error(response, url):
+    """Builds the NotFound exception for a 404 response."""
+    message = _json_message(response, "Resource not found.")
+    if message is None:
+        message = f"Resource not found at {url} with non-JSON response. {_safe_body(response)}"
+    return NotFound(message)
+
+
+# Jump table for error statuses, shared by the single and bulk paths.
+# New codes (409, 422, ...) only need an entry here.
+_ERROR_HANDLERS = {
+    400: _bad_request_error,
+    404: _not_found_error,
+}
+
+
+# --- PREPARED-REQUEST TEMPLATE CACHE FOR BODY-LESS CALLS ---
+# Keyed (method, url); bounded by wholesale reset, which is fine because
+# templates are cheap to rebuild.
+_PREPARED_TEMPLATE_MAX_ENTRIES = 256
+_prepared_templates = {}
+
+
+def _prepared_for(session, method, url, headers):
+    """
+    Returns a PreparedRequest for a body-less call, reusing a cached template.
+
+    prepare_request re-quotes the URL and merges session state on every call;
+    for polling-style requests to a fixed endpoint only the headers change,
+    so re-apply them to a copy of the cached template. Auth headers are
+    signed per call and never stored in the cache.
+    """
+    template = _prepared_templates.get((method, url))
+    if template is None:
+        template = session.prepare_request(requests.Request(method=method, url=url))
+        if len(_prepared_templates) >= _PREPARED_TEMPLATE_MAX_ENTRIES:
+            _prepared_templates.clear()
+        _prepared_templates[(method, url)] = template
+
+    prepared = template.copy()
+    prepared.headers.update(headers)
+    return prepared
+
+
+# --- SHORT-TTL RESPONSE CACHE FOR IDEMPOTENT GETS ---
+# Shared across clients; keys embed the full URL so entries never collide.
+_RESPONSE_CACHE_MAX_ENTRIES = 1024
+_response_cache = {}
+
+
+def _params_cache_key(params):
+    """Normalizes query params into a hashable key; list values become tuples."""
+    return tuple(
+        sorted(
+            (key, tuple(value) if isinstance(value, (list, tuple)) else value)
+            for key, value in params.items()
+        )
+    )
+
+
+def _get_cached_response(cache_key):
+    """Returns a shallow copy of a cached response if the entry is still fresh."""
+    cached = _response_cache.get(cache_key)
+    if cached is None:
+        return None
+
+    expires_at, response = cached
+    if expires_at <= time.monotonic():
+        _response_cache.pop(cache_key, None)
+        return None
+
+    # Copy so callers can't share stream state on the cached object.
+    return copy.copy(response)
+
+
+def _store_cached_response(cache_key, response, ttl):
+    """Stores a successful response, evicting stale entries when the cache is full."""
+    if len(_response_cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        # Snapshot so a concurrent insert can't change the dict mid-scan.
+        for key in [k for k, v in list(_response_cache.items()) if v[0] <= now]:
+            _response_cache.pop(key, None)
+        if len(_response_cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.clear()
+
+    _response_cache[cache_key] = (time.monotonic() + ttl, response)
 
 
 def send_internal_request(
@@ -26,6 +189,7 @@ def send_internal_request(
     secret,
     need_hmac_header=True,
     timeout=DEFAULT_TIMEOUT,
+    use_urllib3=False,
     **kwargs,
 ) -> requests.Response:
     """
@@ -38,6 +202,8 @@ def send_internal_request(
         secret (str): The secret used for authentication.
         need_hmac_header (bool, optional): Whether to include HMAC headers. Defaults to True.
         timeout (int, optional): The timeout for the request. Defaults to DEFAULT_TIMEOUT.
+        use_urllib3 (bool, optional): Bypass the requests layer and send through
+            the shared urllib3 pool. Defaults to False.
         **kwargs: Additional keyword arguments to pass to the requests library.
 
     Returns:
@@ -46,6 +212,16 @@ def send_internal_request(
     Raises:
         InternalServiceError: If the request fails after all retries.
     """
+    method = _METHODS.get(method) or method.upper()
+
+    # Fail fast while the breaker is open: skip header signing for a call
+    # that the adapter would reject anyway.
+    host = _split_url(url)[0]
+    if is_circuit_open(host):
+        error_message = f"Circuit breaker is open for {host}. Failing fast for {method} {url}."
+        logger.warning(error_message)
+        raise InternalServiceError(error_message)
+
     headers = kwargs.pop("headers", {})
     try:
         if need_hmac_header:
@@ -55,10 +231,43 @@ def send_internal_request(
 
         headers.update(auth_headers)
 
+        if use_urllib3:
+            # The urllib3 fast path only understands params/json/data;
+            # drop requests-only kwargs (allow_redirects, stream, ...) so
+            # flipping USE_URLLIB3 never breaks an existing call site.
+            dropped = set(kwargs) - _URLLIB3_KWARGS
+            for key in dropped:
+                logger.debug(
+                    "urllib3 fast path ignores %s for %s %s", key, method, url
+                )
+                kwargs.pop(key)
+            return urllib3_request(
+                method, url, headers=headers, timeout=timeout, **kwargs
+            )
+
         session = get_session(url)
-        response = session.request(
-            method=method.upper(), url=url, headers=headers, timeout=timeout, **kwargs
-        )
+
+        send_kwargs = {
+            "timeout": timeout,
+            "allow_redirects": kwargs.pop("allow_redirects", True),
+            "stream": kwargs.pop("stream", False),
+            "verify": kwargs.pop("verify", True),
+            "cert": kwargs.pop("cert", None),
+            "proxies": kwargs.pop("proxies", {}),
+        }
+
+        # Prepare and send directly instead of session.request(), skipping
+        # merge_environment_settings (env proxies / CA overrides are not
+        # used for internal service calls).
+        if kwargs:
+            request = requests.Request(
+                method=method, url=url, headers=headers, **kwargs
+            )
+            prepared = session.prepare_request(request)
+        else:
+            # Body-less hot path (health checks, polling): reuse a template.
+            prepared = _prepared_for(session, method, url, headers)
+        response = session.send(prepared, **send_kwargs)
 
         # self healing session if status code >= 500
         if response.status_code >= 500:
@@ -68,10 +277,20 @@ def send_internal_request(
             invalidate_session(url)
         return response
 
+    except urllib3.exceptions.HTTPError as e:
+        error_message = (
+            f"Failed to connect to {method} {url} after all retries. Error: {e}"
+        )
+        logger.error(error_message)
+        raise InternalServiceError(error_message) from e
+    except pybreaker.CircuitBreakerError as e:
+        error_message = f"Circuit breaker rejected {method} {url}: {e}"
+        logger.error(error_message)
+        raise InternalServiceError(error_message) from e
     except requests.exceptions.RequestException as e:
         invalidate_session(url)
         error_message = (
-            f"Failed to connect to {method.upper()} {url} after all retries. Error: {e}"
+            f"Failed to connect to {method} {url} after all retries. Error: {e}"
         )
         logger.error(error_message)
         raise InternalServiceError(error_message) from e
@@ -118,68 +337,110 @@ def _perform_single_request(method, url, **kwargs):
 
 
 def send_bulk_internal_requests(
-    requests_data: list, service_id: str, secret: str, default_timeout=DEFAULT_TIMEOUT
+    requests_data: list,
+    service_id: str,
+    secret: str,
+    default_timeout=DEFAULT_TIMEOUT,
+    pool_size=None,
 ):
     """
     Sends multiple internal requests in parallel using native Gevent Pool + requests.
 
+    When gevent is not installed, a bounded ThreadPoolExecutor is used instead;
+    requests.Session is thread-safe for plain request/response usage, so the
+    results contract is identical.
+
     Args:
         requests_data (list): A list of dictionaries containing request details.
         service_id (str): The service ID used for authentication.
         secret (str): The secret used for authentication.
         default_timeout (int, optional): The default timeout for requests. Defaults to DEFAULT_TIMEOUT.
+        pool_size (int, optional): Max concurrent requests. Defaults to the batch
+            size, capped at DEFAULT_BULK_POOL_SIZE.
 
     Returns:
         list: A list of responses from the requests.
     """
+    if not requests_data:
+        return []
 
-    pool = Pool(10)
-    jobs = []
+    if pool_size is None:
+        pool_size = min(len(requests_data), DEFAULT_BULK_POOL_SIZE)
 
-    for req_data in requests_data:
+    # HMAC signatures only depend on (method, path, second), so duplicate
+    # entries in one batch can share headers instead of re-hashing.
+    auth_header_cache = {}
+
+    def _prepare_one(req_data):
+        """Builds one (method, url, request_kwargs) tuple, or None when skipped."""
         try:
-            method = req_data.get("method", "GET").upper()
+            raw_method = req_data.get("method", "GET")
+            method = _METHODS.get(raw_method) or raw_method.upper()
             url = req_data["url"]
 
-            kwargs = req_data.copy()
-            kwargs.pop("method", None)
-            kwargs.pop("url", None)
-            kwargs.pop("endpoint", None)
+            # Fail fast for open circuits; the placeholder keeps results
+            # aligned with requests_data.
+            if is_circuit_open(_split_url(url)[0]):
+                logger.warning(
+                    f"Circuit breaker open; skipping bulk request to {url}."
+                )
+                return None
 
-            headers = kwargs.pop("headers", {})
-            need_hmac = kwargs.pop("need_hmac_header", True)
-            timeout = kwargs.pop("timeout", default_timeout)
+            headers = dict(req_data.get("headers") or {})
+            need_hmac = req_data.get("need_hmac_header", True)
+            timeout = req_data.get("timeout", default_timeout)
+            kwargs = {
+                k: v for k, v in req_data.items() if k not in _RESERVED_BULK_KEYS
+            }
 
             # Auth Headers
             if need_hmac:
-                auth_headers = generate_internal_headers(
-                    method, url, service_id, secret
-                )
+                cache_key = (method, _split_url(url)[1], _current_timestamp()[0])
             else:
-                auth_headers = generate_api_key_header(secret, service_id)
-            headers.update(auth_headers)
+                cache_key = "apikey"
 
-            request_kwargs = {"headers": headers, "timeout": timeout, **kwargs}
+            auth_headers = auth_header_cache.get(cache_key)
+            if auth_headers is None:
+                if need_hmac:
+                    auth_headers = generate_internal_headers(
+                        method, url, service_id, secret
+                    )
+                else:
+                    auth_headers = generate_api_key_header(secret, service_id)
+                auth_header_cache[cache_key] = auth_headers
+            headers.update(auth_headers)
 
-            job = pool.spawn(_perform_single_request, method, url, **request_kwargs)
-            jobs.append(job)
+            return (method, url, {"headers": headers, "timeout": timeout, **kwargs})
 
         except Exception as e:
             logger.error(
                 f"Failed to prepare bulk request for data {req_data}. Error: {e}",
                 exc_info=True,
             )
-
-            continue
-
-    if not jobs:
-        return []
-
-    pool.join()
-
-    results = [job.value for job in jobs]
-
-    return results
+            return None
+
+    # map() keeps the per-item dispatch at the C level for large fan-outs.
+    prepared_requests = list(map(_prepare_one, requests_data))
+
+    if Pool is not None:
+        pool = Pool(pool_size)
+        jobs = [
+            pool.spawn(_perform_single_request, *prepared[:2], **prepared[2])
+            if prepared is not None
+            else None
+            for prepared in prepared_requests
+        ]
+        pool.join()
+        return [job.value if job is not None else None for job in jobs]
+
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        futures = [
+            executor.submit(_perform_single_request, *prepared[:2], **prepared[2])
+            if prepared is not None
+            else None
+            for prepared in prepared_requests
+        ]
+        return [future.result() if future is not None else None for future in futures]
 
 
 class BaseServiceClient:
@@ -211,9 +472,21 @@ class BaseServiceClient:
     SERVICE_ID = None
     SECRET = None
 
+    # How this client authenticates: "hmac" (signed requests) or "apikey".
+    # API-key subclasses skip one SHA-256 HMAC per request.
+    AUTH_MODE = "hmac"
+
+    # Send single requests through the shared urllib3 pool instead of the
+    # requests layer. Cheaper per call; responses are Urllib3Response shims.
+    USE_URLLIB3 = False
+
+    # TTL in seconds for caching successful GET responses. Disabled by default;
+    # subclasses with hot, tolerant-to-staleness read endpoints can opt in.
+    CACHE_TTL_SECONDS = 0
+
     @classmethod
     def _execute_request(
-        cls, method: str, endpoint: str, need_hmac_header=True, **kwargs
+        cls, method: str, endpoint: str, need_hmac_header=None, **kwargs
     ) -> requests.Response:
         """
         Executes the request and handles standard response logic.
@@ -221,7 +494,8 @@ class BaseServiceClient:
         Args:
             method (str): The HTTP method to use for the request.
             endpoint (str): The endpoint to make the request to.
-            need_hmac_header (bool, optional): Whether to include HMAC headers. Defaults to True.
+            need_hmac_header (bool, optional): Whether to include HMAC headers.
+                Defaults to the class AUTH_MODE.
 
         Returns:
             requests.Response: The response from the request.
@@ -231,8 +505,21 @@ class BaseServiceClient:
                 "BASE_URL, SERVICE_ID, and SECRET must be set in the subclass."
             )
 
+        if need_hmac_header is None:
+            need_hmac_header = cls.AUTH_MODE == "hmac"
+
         full_url = f"{cls.BASE_URL.rstrip('/')}/{endpoint.lstrip('/')}"
 
+        method = _METHODS.get(method) or method.upper()
+
+        cache_key = None
+        if cls.CACHE_TTL_SECONDS > 0 and method == "GET":
+            params = kwargs.get("params") or {}
+            cache_key = (full_url, _params_cache_key(params))
+            cached_response = _get_cached_response(cache_key)
+            if cached_response is not None:
+                return cached_response
+
         try:
             response = send_internal_request(
                 method,
@@ -240,32 +527,23 @@ class BaseServiceClient:
                 service_id=cls.SERVICE_ID,
                 secret=cls.SECRET,
                 need_hmac_header=need_hmac_header,
+                use_urllib3=cls.USE_URLLIB3,
                 **kwargs,
             )
 
-            if 200 <= response.status_code < 300:
+            status = response.status_code
+            if 200 <= status < 300:
+                if cache_key is not None:
+                    _store_cached_response(cache_key, response, cls.CACHE_TTL_SECONDS)
                 return response
-            elif response.status_code == 400:
-                try:
-                    error_message = response.json().get("message", "Bad Request")
-                    raise BadRequest(f"{error_message}")
-                except ValueError:
-                    error_message = f"Bad Request at {full_url} with non-JSON response. {response.text}"
-                    raise BadRequest(error_message)
-
-            elif response.status_code == 404:
-                try:
-                    error_message = response.json().get(
-                        "message", "Resource not found."
-                    )
-                    raise NotFound(f"{error_message}")
-                except ValueError:
-                    error_message = f"Resource not found at {full_url} with non-JSON response. {response.text}"
-                    raise NotFound(error_message)
-            else:
-                raise ServiceError(
-                    f"Service returned an unexpected status {response.status_code} at {full_url}: {response.text}"
-                )
+
+            handler = _ERROR_HANDLERS.get(status)
+            if handler is not None:
+                raise handler(response, full_url)
+
+            raise ServiceError(
+                f"Service returned an unexpected status {status} at {full_url}: {_safe_body(response)}"
+            )
 
         except InternalServiceError as e:
             logger.error(f"A critical connectivity error occurred with {full_url}: {e}")
@@ -291,6 +569,7 @@ class BaseServiceClient:
             full_url = f"{cls.BASE_URL.rstrip('/')}/{req['endpoint'].lstrip('/')}"
             new_req = req.copy()
             new_req["url"] = full_url
+            new_req.setdefault("need_hmac_header", cls.AUTH_MODE == "hmac")
             processed_data.append(new_req)
 
         raw_responses = send_bulk_internal_requests(
@@ -312,39 +591,18 @@ class BaseServiceClient:
                 )
                 continue
 
-            if 200 <= res.status_code < 300:
+            status = res.status_code
+            if 200 <= status < 300:
                 processed_results.append(res)
-            elif res.status_code == 400:
-                msg = cls._parse_error_response(res, "Bad Request")
-                processed_results.append(BadRequest(msg))
-            elif res.status_code == 404:
-                msg = cls._parse_error_response(res, "Resource not found")
-                processed_results.append(NotFound(msg))
+                continue
+
+            handler = _ERROR_HANDLERS.get(status)
+            if handler is not None:
+                processed_results.append(handler(res, res.request.url))
             else:
                 # unexpected example is 500
                 processed_results.append(
-                    ServiceError(
-                        f"Unexpected status {res.status_code} for URL: {res.request.url}"
-                    )
+                    ServiceError(f"Unexpected status {status} for URL: {res.request.url}")
                 )
 
         return processed_results
-
-    @staticmethod
-    def _parse_error_response(response: requests.Response, default_message: str) -> str:
-        """
-        Parses the error message from a response.
-
-        Args:
-            response (requests.Response): The response to parse.
-            default_message (str): The default error message to use if the response cannot be parsed.
-
-        Returns:
-            str: The parsed error message.
-        """
-        try:
-            return response.json().get("message", default_message)
-        except ValueError:
-            return (
-                f"{default_message} URL: {response.request.url} | Body: {response.text}"
-            )
@@ -6,6 +6,8 @@ This module provides custom exceptions for handling errors in the application.
 class InternalServiceError(Exception):
     """Exception raised when an internal service call fails after all retries."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message, *args):
         self.message = message
         super().__init__(self.message, *args)
@@ -14,22 +16,28 @@ class InternalServiceError(Exception):
 class ServiceClientError(Exception):
     """Base exception for all error from service client"""
 
-    pass
+    __slots__ = ()
 
 
 class NotFound(ServiceClientError):
     """Exception raised when response status code is 404."""
 
-    pass
+    __slots__ = ()
 
 
 class BadRequest(ServiceClientError):
     """Exception raised when response status code is 400."""
 
-    pass
+    __slots__ = ()
 
 
 class ServiceError(ServiceClientError):
     """Exception raised when response status code is 500."""
 
-    pass
+    __slots__ = ()
+
+
+class BulkheadFull(ServiceClientError):
+    """Exception raised when a host's in-flight request limit is saturated."""
+
+    __slots__ = ()
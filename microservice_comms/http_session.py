@@ -1,53 +1,376 @@
-import functools
+import json as _json
 import logging
-from collections import defaultdict
-from http.cookiejar import CookiePolicy
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlencode
 
 import pybreaker
 import requests
+import urllib3
 from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
 from urllib3.util.retry import Retry
 
+from ._urlutil import _split_url
+from .errors import BulkheadFull
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = (3.05, 10)  # (connect, read)
 DEFAULT_MAX_RETRY = 3
+DEFAULT_POOL_CONNECTIONS = 50
+# Should be >= the expected number of in-flight requests per host.
+DEFAULT_POOL_MAXSIZE = 100
 DEFAULT_FAIL_MAX = 5
 DEFAULT_RESET_TIMEOUT = 60
+# Bulkhead: max in-flight requests per host, so one slow upstream can't
+# absorb every worker in the process.
+DEFAULT_BULKHEAD_SIZE = 50
+DEFAULT_BULKHEAD_WAIT = 1.0
+
+# Shared retry strategy: Retry is immutable per config, so one instance can
+# back every adapter instead of being rebuilt per session. backoff_jitter
+# (urllib3 >= 2.0) spreads retry arrivals so N clients failing together
+# don't retry in lockstep; Retry-After on 429/503 is honored by default.
+_DEFAULT_RETRY = Retry(
+    total=DEFAULT_MAX_RETRY,
+    backoff_factor=0.5,
+    backoff_jitter=0.5,
+    backoff_max=30,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(
+        {"HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"}
+    ),
+    raise_on_status=False,
+    respect_retry_after_header=True,
+)
 
 # --- GLOBAL SESSION CACHE ---
-# Global session cache
-_session_cache = {}
+# Global session cache, shared process-wide so every greenlet/thread reuses
+# the same per-host connection pools. LRU-bounded at _MAX_HOSTS so
+# multi-tenant callers hitting many distinct hosts can't leak pools/FDs
+# forever; evicted sessions are closed.
+_MAX_HOSTS = 256
+_session_cache = OrderedDict()
+_session_cache_lock = threading.Lock()
+
+# Circuit Breaker Store. A plain dict (not a defaultdict) so read-only
+# probes like is_circuit_open never allocate a breaker by accident.
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+# Shared backing store for breaker state: one plain slot dict per host,
+# all hanging off a single module-level dict. Trip state can be inspected
+# or exported in one place, and swapping in an external storage (e.g.
+# CircuitBreakerRedisStorage for multi-replica coordination) only touches
+# _get_breaker.
+_breaker_state = {}
+
+
+class _HostKeyedBreakerStorage(pybreaker.CircuitBreakerStorage):
+    """pybreaker storage view over one host's slot in the shared state dict."""
+
+    def __init__(self, host):
+        super().__init__("host-keyed-memory")
+        self._slot = _breaker_state.setdefault(
+            host,
+            {
+                "state": pybreaker.STATE_CLOSED,
+                "fail_counter": 0,
+                "success_counter": 0,
+                "opened_at": None,
+            },
+        )
+
+    @property
+    def state(self):
+        return self._slot["state"]
+
+    @state.setter
+    def state(self, state):
+        self._slot["state"] = state
+
+    def increment_counter(self):
+        self._slot["fail_counter"] += 1
+
+    def reset_counter(self):
+        self._slot["fail_counter"] = 0
+
+    def increment_success_counter(self):
+        self._slot["success_counter"] += 1
+
+    def reset_success_counter(self):
+        self._slot["success_counter"] = 0
+
+    @property
+    def counter(self):
+        return self._slot["fail_counter"]
+
+    @property
+    def success_counter(self):
+        return self._slot["success_counter"]
+
+    @property
+    def opened_at(self):
+        return self._slot["opened_at"]
+
+    @opened_at.setter
+    def opened_at(self, opened_at):
+        self._slot["opened_at"] = opened_at
+
+
+def _get_breaker(host: str) -> pybreaker.CircuitBreaker:
+    """Returns the shared circuit breaker for a host, creating it on first use."""
+    breaker = _breakers.get(host)
+    if breaker is not None:
+        return breaker
+
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = pybreaker.CircuitBreaker(
+                fail_max=DEFAULT_FAIL_MAX,
+                reset_timeout=DEFAULT_RESET_TIMEOUT,
+                state_storage=_HostKeyedBreakerStorage(host),
+                name=host,
+            )
+
+        return breaker
 
-# Circuit Breaker Store
-_breakers = defaultdict(
-    lambda: pybreaker.CircuitBreaker(
-        fail_max=DEFAULT_FAIL_MAX, reset_timeout=DEFAULT_RESET_TIMEOUT
-    )
-)
+
+# Bulkhead registry, one BoundedSemaphore per host.
+_bulkheads = {}
+_bulkheads_lock = threading.Lock()
+
+
+def _get_bulkhead(host: str, size=DEFAULT_BULKHEAD_SIZE) -> threading.BoundedSemaphore:
+    """Returns the shared bulkhead semaphore for a host, creating it on first use."""
+    bulkhead = _bulkheads.get(host)
+    if bulkhead is not None:
+        return bulkhead
+
+    with _bulkheads_lock:
+        bulkhead = _bulkheads.get(host)
+        if bulkhead is None:
+            bulkhead = _bulkheads[host] = threading.BoundedSemaphore(size)
+
+        return bulkhead
+
+
+def is_circuit_open(host: str) -> bool:
+    """
+    Best-effort check whether the circuit breaker for a host is currently open.
+
+    Lets callers fail fast before doing per-request work (e.g. HMAC signing)
+    that the breaker would throw away anyway. Returns False once the reset
+    timeout has elapsed so half-open recovery probes are never suppressed.
+
+    Args:
+        host (str): The host (netloc) to check.
+
+    Returns:
+        bool: True if the breaker is open and still within its reset window.
+    """
+    breaker = _breakers.get(host)
+    if breaker is None or breaker.current_state != pybreaker.STATE_OPEN:
+        return False
+
+    # opened_at lives on the breaker's storage; pybreaker exposes no public
+    # accessor for it, so mirror the check its open state performs internally.
+    opened_at = breaker._state_storage.opened_at
+    if opened_at is None:
+        return False
+
+    reset_at = opened_at + timedelta(seconds=breaker.reset_timeout)
+    return datetime.now(timezone.utc) < reset_at
 
 
 # --- BLOCK ALL COOKIES ---
-class BlockAllCookies(CookiePolicy):
-    return_ok = set_ok = domain_return_ok = path_return_ok = (
-        lambda self, *args, **kwargs: False
-    )
-    netscape = True
-    rfc2965 = hide_cookie2 = False
+class _NullCookieJar(RequestsCookieJar):
+    """Cookie jar that never stores or sends anything.
+
+    The old BlockAllCookies policy still ran the full cookiejar machinery on
+    every request/response just to answer "no"; overriding the two entry
+    points requests actually calls skips that work entirely.
+    """
+
+    def extract_cookies(self, *args, **kwargs):
+        pass
+
+    def add_cookie_header(self, *args, **kwargs):
+        pass
+
+
+class _UpstreamServerError(Exception):
+    """Internal signal so terminal 5xx responses count as breaker failures."""
+
+    def __init__(self, response):
+        self.response = response
+        super().__init__(f"upstream returned {response.status_code}")
 
 
 class BreakerAdapter(HTTPAdapter):
-    def __init__(self, host, *args, **kwargs):
+    """HTTPAdapter that routes every send through a host's circuit breaker.
+
+    The breaker is resolved once at construction (the adapter is mounted
+    per-host anyway), so send() never parses request.url; anything that does
+    need a host from a full URL should go through _urlutil._split_url rather
+    than ad-hoc string splitting.
+    """
+
+    def __init__(self, breaker, bulkhead, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.host = host
+        self.breaker = breaker
+        self.bulkhead = bulkhead
 
     def send(self, request, **kwargs):
-        host = request.url.split("/")[2]
-        breaker = _breakers[host]
-        return breaker.call(super().send, request, **kwargs)
+        # Session.send always forwards timeout (None when unset), so a plain
+        # setdefault would never fire; per-call timeouts still win here.
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+
+        # Bulkhead: cap in-flight requests per host so a slow upstream can't
+        # stall every caller in the process.
+        if not self.bulkhead.acquire(timeout=DEFAULT_BULKHEAD_WAIT):
+            raise BulkheadFull(
+                f"Too many in-flight requests; bulkhead rejected {request.url}"
+            )
+
+        def _send_checked():
+            # raise_on_status=False means urllib3's retries return the final
+            # 5xx instead of raising, so the breaker would never see server
+            # errors at all; surface them as failures here.
+            response = super(BreakerAdapter, self).send(request, **kwargs)
+            if response.status_code >= 500:
+                raise _UpstreamServerError(response)
+            return response
+
+        try:
+            return self.breaker.call(_send_checked)
+        except _UpstreamServerError as e:
+            # Callers still get the 5xx response; the breaker has already
+            # recorded it as one externally visible failure.
+            return e.response
+        finally:
+            self.bulkhead.release()
+
+
+# --- RAW URLLIB3 HOT PATH ---
+# Shared PoolManager for clients that opt out of the requests layer.
+_pool_manager = None
+_pool_manager_lock = threading.Lock()
+
+
+def _get_pool_manager() -> urllib3.PoolManager:
+    """Lazily builds the shared urllib3.PoolManager with the default retry strategy."""
+    global _pool_manager
+    if _pool_manager is None:
+        with _pool_manager_lock:
+            if _pool_manager is None:
+                _pool_manager = urllib3.PoolManager(
+                    maxsize=DEFAULT_POOL_MAXSIZE, retries=_DEFAULT_RETRY
+                )
+    return _pool_manager
+
+
+class _RequestInfo:
+    """Minimal stand-in for requests' response.request attribute."""
+
+    __slots__ = ("url",)
 
+    def __init__(self, url):
+        self.url = url
 
-def create_session(base_url: str):
+
+class Urllib3Response:
+    """
+    Thin requests.Response-compatible view over a urllib3 response.
+
+    Exposes status_code, content, text, json(), headers, and request.url so
+    BaseServiceClient's response handling works unchanged.
+    """
+
+    __slots__ = ("status_code", "content", "headers", "request")
+
+    def __init__(self, raw, url):
+        self.status_code = raw.status
+        self.content = raw.data
+        self.headers = raw.headers
+        self.request = _RequestInfo(url)
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return _json.loads(self.content)
+
+
+def urllib3_request(
+    method, url, headers=None, timeout=DEFAULT_TIMEOUT, params=None, json=None, data=None
+) -> Urllib3Response:
+    """
+    Sends a request straight through the shared urllib3.PoolManager.
+
+    Skips the requests layer (cookie jar, hooks, env merging) for the internal
+    hot path while keeping the retry strategy and circuit breaker. Raises
+    urllib3.exceptions.HTTPError subclasses on connection failures.
+
+    Args:
+        method (str): The upper-cased HTTP method.
+        url (str): The absolute URL to call.
+        headers (dict, optional): Headers to send.
+        timeout: A (connect, read) tuple or a float, as for requests.
+        params (dict, optional): Query parameters appended to the URL.
+        json (optional): JSON-serializable request body.
+        data (optional): Raw request body; ignored when json is given.
+
+    Returns:
+        Urllib3Response: The response shim.
+    """
+    if params:
+        url = f"{url}?{urlencode(params)}"
+
+    body = None
+    if json is not None:
+        body = _json.dumps(json).encode()
+    elif data is not None:
+        body = data
+
+    if isinstance(timeout, tuple):
+        timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+
+    breaker = _get_breaker(_split_url(url)[0])
+    raw = breaker.call(
+        _get_pool_manager().request,
+        method,
+        url,
+        headers=headers,
+        body=body,
+        timeout=timeout,
+    )
+    return Urllib3Response(raw, url)
+
+
+def _warmup_session(session, base_url):
+    """Issues a background HEAD so the pool holds a live connection before real traffic."""
+    try:
+        session.head(base_url, timeout=DEFAULT_TIMEOUT)
+    except Exception as e:
+        # An unreachable host must not break session creation; real calls
+        # will go through the circuit breaker as usual.
+        logger.warning("Connection warm-up for %s failed: %s", base_url, e)
+
+
+def create_session(
+    base_url: str,
+    pool_connections=DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize=DEFAULT_POOL_MAXSIZE,
+    pool_block=True,
+    warmup=False,
+    bulkhead_size=DEFAULT_BULKHEAD_SIZE,
+):
     """
     Creates a requests session object for the given base_url.
 
@@ -55,39 +378,50 @@ def create_session(base_url: str):
     - A retry strategy that retries up to DEFAULT_MAX_RETRY times with a backoff factor of 0.5.
     - A circuit breaker that trips after DEFAULT_FAIL_MAX failures within DEFAULT_RESET_TIMEOUT seconds.
     - A block-all-cookies policy to prevent session leaks between users.
-    - A default timeout of DEFAULT_TIMEOUT seconds.
+    - A blocking connection pool by default, so concurrency beyond pool_maxsize
+      waits for a free connection instead of discarding keep-alive connections.
 
     :param base_url: The base URL of the service.
+    :param pool_connections: Number of per-host pools to cache.
+    :param pool_maxsize: Max connections per host; size to expected in-flight requests.
+    :param pool_block: Whether to block when the pool is exhausted.
+    :param warmup: Issue a background HEAD request so the first real call
+        doesn't pay the DNS + TCP + TLS handshake on its critical path.
+    :param bulkhead_size: Max in-flight requests for this host before calls
+        are rejected with BulkheadFull.
     :return: A requests session object.
     """
-    retry_strategy = Retry(
-        total=DEFAULT_MAX_RETRY,
-        backoff_factor=0.5,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-        raise_on_status=False,
-    )
-
-    host = base_url.split("/")[2]
+    host = _split_url(base_url)[0]
     adapter = BreakerAdapter(
-        host, max_retries=retry_strategy, pool_connections=20, pool_maxsize=20
+        _get_breaker(host),
+        _get_bulkhead(host, bulkhead_size),
+        max_retries=_DEFAULT_RETRY,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
     )
 
     session = requests.Session()
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
+    # Mount only the scheme this base_url uses: the two default adapters each
+    # preallocate a PoolManager we'd never touch, and every send does a
+    # prefix scan over the mounts to pick one.
+    scheme = base_url.split("://", 1)[0] + "://"
+    session.adapters.clear()
+    session.mount(scheme, adapter)
 
     # SAFETY: BLOCK COOKIES
-    session.cookies.set_policy(BlockAllCookies())
+    session.cookies = _NullCookieJar()
     session.auth = None
 
-    # enforce default timeout
-    original_request = session.request
-    session.request = functools.partial(original_request, timeout=DEFAULT_TIMEOUT)
+    if warmup:
+        threading.Thread(
+            target=_warmup_session, args=(session, base_url), daemon=True
+        ).start()
+
     return session
 
 
-def get_session(base_url: str) -> requests.Session:
+def get_session(base_url: str, **session_kwargs) -> requests.Session:
     """
     Retrieves a requests session object from the global session cache for a given base_url.
 
@@ -96,17 +430,49 @@ def get_session(base_url: str) -> requests.Session:
 
     Args:
         base_url (str): The base URL of the service to retrieve the session for.
+        **session_kwargs: Pool sizing options forwarded to create_session
+            (pool_connections, pool_maxsize, pool_block). Only applied when
+            the session for this host is first created.
 
     Returns:
         requests.Session: The session object for the given base_url.
     """
-    host = base_url.split("/")[2]
+    host = _split_url(base_url)[0]
+
+    # Lock-free fast path: cache hits (the common case) skip the lock.
+    # invalidate_session may pop the host between the get and the
+    # move_to_end, so treat a KeyError as a miss and fall through.
+    session = _session_cache.get(host)
+    if session is not None:
+        try:
+            _session_cache.move_to_end(host)
+        except KeyError:
+            pass
+        else:
+            return session
 
-    # Check cache global
-    if host not in _session_cache:
-        _session_cache[host] = create_session(base_url)
+    # Double-checked miss path so concurrent callers don't build duplicate
+    # pools for the same host.
+    with _session_cache_lock:
+        session = _session_cache.get(host)
+        if session is None:
+            session = _session_cache[host] = create_session(
+                base_url, **session_kwargs
+            )
 
-    return _session_cache[host]
+            # Evict least-recently-used hosts beyond the cap.
+            while len(_session_cache) > _MAX_HOSTS:
+                evicted_host, evicted_session = _session_cache.popitem(last=False)
+                logger.warning(
+                    "Session cache full; closing LRU session for host: %s",
+                    evicted_host,
+                )
+                try:
+                    evicted_session.close()
+                except Exception as e:
+                    logger.error("Error closing session for %s: %s", evicted_host, e)
+
+        return session
 
 
 def invalidate_session(base_url: str):
@@ -123,14 +489,21 @@ def invalidate_session(base_url: str):
     Returns:
         None
     """
-    host = base_url.split("/")[2]
+    host = _split_url(base_url)[0]
 
-    if host in _session_cache:
-        logger.warning(
-            f"Invalidating and closing session pool for host: {host} due to connection errors."
-        )
-        try:
-            old_session = _session_cache.pop(host)
-            old_session.close()
-        except Exception as e:
-            logger.error(f"Error closing session for {host}: {e}")
+    # Single atomic pop versus a racing get_session or invalidation; closing
+    # happens outside the lock since it can block on in-flight connections.
+    with _session_cache_lock:
+        old_session = _session_cache.pop(host, None)
+
+    if old_session is None:
+        return
+
+    logger.warning(
+        "Invalidating and closing session pool for host: %s due to connection errors.",
+        host,
+    )
+    try:
+        old_session.close()
+    except Exception as e:
+        logger.error("Error closing session for %s: %s", host, e)
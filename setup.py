@@ -1,16 +1,31 @@
 from setuptools import find_packages, setup
 
+try:
+    with open("README.md", encoding="utf-8") as f:
+        long_description = f.read()
+except FileNotFoundError:
+    long_description = ""
+
 setup(
     name="microservice_comms",
     version="1.7.3",
     author="Markus Ganteng dan Intelek",
     author_email="markus.rabin.r@gmail.com",
     description="A shared library for internal microservice communication.",
-    long_description=open("README.md").read(),
+    long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/haiser1/microservice_comms",
-    packages=find_packages(),
-    install_requires=["requests>=2.20.0", "pybreaker>=0.6.0", "gevent>=21.12.0"],
+    packages=find_packages(include=["microservice_comms", "microservice_comms.*"]),
+    install_requires=[
+        "requests>=2.20.0",
+        "urllib3>=2.0.0",
+        "pybreaker>=1.4.0",
+        "gevent>=21.12.0",
+    ],
+    extras_require={
+        "async": ["httpx[http2]>=0.23.0"],
+        "aiohttp": ["aiohttp>=3.8.0"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -68,6 +68,20 @@ def test_raises_service_error_on_500(service_client, requests_mock):
         service_client._execute_request("GET", "/500-error")
 
 
+def test_get_response_cache_with_ttl(service_client, requests_mock):
+    """Test cache respons GET saat CACHE_TTL_SECONDS diaktifkan."""
+    full_url = "http://test-service.com/cached"
+    requests_mock.get(full_url, json={"ok": True}, status_code=200)
+
+    service_client.CACHE_TTL_SECONDS = 60
+    first = service_client._execute_request("GET", "/cached")
+    second = service_client._execute_request("GET", "/cached")
+
+    assert first.json() == second.json() == {"ok": True}
+    # Request kedua harus dilayani dari cache, bukan dari jaringan
+    assert requests_mock.call_count == 1
+
+
 def test_raises_bad_request_on_400(service_client, requests_mock):
     """Test untuk exception BadRequest saat status 400."""
     full_url = "http://test-service.com/400-error"